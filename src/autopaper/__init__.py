@@ -1,12 +1,20 @@
 """AutoPaper public package interface."""
 
-from .arxiv import ArxivAPI
-from .display import PaperDisplayer
-from .feishu import FeishuBitableConfig, FeishuBitableConnector, FeishuSyncResult, sync_papers_to_feishu
-from .ranking import PaperRanker
+from importlib import import_module
 
 __version__ = "0.1.0"
 
+# 公共类按需导入：``autopaper --help`` 等轻量命令不必加载 arxiv / requests 等依赖（终端输出仍依赖 rich）
+_LAZY_EXPORTS = {
+    "ArxivAPI": ".arxiv",
+    "PaperDisplayer": ".display",
+    "FeishuBitableConfig": ".feishu",
+    "FeishuBitableConnector": ".feishu",
+    "FeishuSyncResult": ".feishu",
+    "sync_papers_to_feishu": ".feishu",
+    "PaperRanker": ".ranking",
+}
+
 
 def find_sync_configs(*args, **kwargs):
     from .configuration import find_sync_configs as _find_sync_configs
@@ -41,6 +49,11 @@ def get_default_config_dir():
 def __getattr__(name: str):
     if name == "DEFAULT_CONFIG_DIR":
         return get_default_config_dir()
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
     raise AttributeError(f"module 'autopaper' has no attribute {name!r}")
 
 
@@ -11,6 +11,10 @@ import arxiv
 
 from ..terminal import print
 
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RUN = re.compile(r"\s+")
+_NON_FILENAME_CHARS = re.compile(r"[^\w\-_.]")
+
 
 class ArxivDownloadMixin:
     def download_pdf(
@@ -110,11 +114,10 @@ class ArxivDownloadMixin:
     def _sanitize_filename(self, filename: str) -> str:
         """清理文件名，移除不合法字符"""
         # 移除或替换不合法字符
-        invalid_chars = r'[<>:"/\\|?*]'
-        sanitized = re.sub(invalid_chars, "_", filename)
+        sanitized = _INVALID_FILENAME_CHARS.sub("_", filename)
         # 移除多余空格和标点
-        sanitized = re.sub(r"\s+", "_", sanitized)
-        sanitized = re.sub(r"[^\w\-_.]", "", sanitized)
+        sanitized = _WHITESPACE_RUN.sub("_", sanitized)
+        sanitized = _NON_FILENAME_CHARS.sub("", sanitized)
         return sanitized.strip("_")
 
     def _create_paper_metadata(self, paper: Dict[str, Any], md_path: Path) -> None:
@@ -8,11 +8,13 @@ import io
 import os
 import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from importlib import resources
 from pathlib import Path
 from typing import Iterable, Optional
+from urllib.parse import unquote
 
-import requests
 from dotenv import load_dotenv
 
 from .. import __version__
@@ -30,7 +32,7 @@ from ..configuration import (
     validate_config,
 )
 from ..configuration.loader import resolve_config_dir
-from ..sync import process_all_configs, process_single_config
+from ..env import load_default_env
 from ..terminal import bullet_list, debug, error, info, key_values, panel, print, set_output_mode, success, table
 
 
@@ -117,7 +119,7 @@ def cmd_init(args: argparse.Namespace) -> int:
     config_count = _copy_tree(_package_path("config"), target / "conf", args.force)
     env_path = target / ".env.template"
     if args.force or not env_path.exists():
-        shutil.copy2(_package_path("templates", "env.template"), env_path)
+        _atomic_copy(_package_path("templates", "env.template"), env_path)
         env_status = "created"
     else:
         env_status = "exists"
@@ -161,6 +163,8 @@ def cmd_sync(args: argparse.Namespace) -> int:
     except FileNotFoundError:
         cfg = _load_runtime_config(args.config_dir)
     configure_network(cfg)
+    from ..sync import process_all_configs, process_single_config
+
     common_kwargs = {
         "dry_run": args.dry_run,
         "no_feishu": args.no_feishu,
@@ -202,6 +206,33 @@ def cmd_health(args: argparse.Namespace) -> int:
     passed = 0
     total = 0
 
+    # 网络探测耗时最长，先在后台线程发出请求，与本地检查重叠执行
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        network_future = None
+        if not args.skip_network:
+            timeout = args.timeout if args.timeout is not None else settings.healthcheck.timeout_seconds
+            network_future = executor.submit(_check_arxiv_connectivity, healthcheck_url(cfg), timeout)
+        local_passed, local_total = _run_local_health_checks(args, cfg, settings)
+        passed += local_passed
+        total += local_total
+
+        if network_future is not None:
+            total += 1
+            ok, message = network_future.result()
+            if ok:
+                success(message)
+                passed += 1
+            else:
+                error(message)
+
+    key_values("Health Check", {"passed": passed, "total": total, "status": "ok" if passed == total else "failed"})
+    return 0 if passed == total else 1
+
+
+def _run_local_health_checks(args: argparse.Namespace, cfg, settings: RuntimeSettings) -> tuple[int, int]:
+    passed = 0
+    total = 0
+
     import_passed, import_total = _check_imports(["arxiv", "hydra", "omegaconf", "yaml", "requests"])
     passed += import_passed
     total += import_total
@@ -230,20 +261,18 @@ def cmd_health(args: argparse.Namespace) -> int:
                 details.append(" or ".join(settings.feishu_env.token_any_of))
             print(f"⚠️ Feishu environment variables incomplete: {', '.join(details)}")
 
-    if not args.skip_network:
-        total += 1
-        timeout = args.timeout if args.timeout is not None else settings.healthcheck.timeout_seconds
-        try:
-            response = requests.get(healthcheck_url(cfg), timeout=timeout)
-            response.raise_for_status()
-        except requests.RequestException as exc:
-            error(f"arXiv connectivity: {exc}")
-        else:
-            success(f"arXiv connectivity: HTTP {response.status_code}")
-            passed += 1
+    return passed, total
 
-    key_values("Health Check", {"passed": passed, "total": total, "status": "ok" if passed == total else "failed"})
-    return 0 if passed == total else 1
+
+def _check_arxiv_connectivity(url: str, timeout: float) -> tuple[bool, str]:
+    import requests
+
+    try:
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException as exc:
+        return False, f"arXiv connectivity: {exc}"
+    return True, f"arXiv connectivity: HTTP {response.status_code}"
 
 
 def cmd_smoke_search(args: argparse.Namespace) -> int:
@@ -443,7 +472,7 @@ def _load_env(env_file: Optional[str], *, allow_missing: bool = False) -> bool:
             return False
         load_dotenv(path, override=True)
         return True
-    load_dotenv()
+    load_default_env()
     return True
 
 
@@ -460,11 +489,25 @@ def _copy_tree(src: Path, dst: Path, force: bool) -> int:
         target_path = dst / source_path.name
         if target_path.exists() and not force:
             continue
-        shutil.copy2(source_path, target_path)
+        _atomic_copy(source_path, target_path)
         copied += 1
     return copied
 
 
+def _atomic_copy(source_path: Path, target_path: Path) -> None:
+    # copyfile 在 Linux 上已走内核零拷贝；先写同目录临时文件再 os.replace，
+    # 保证 --force 覆盖时中途失败不会留下被截断的配置
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{target_path.name}.", suffix=".tmp", dir=target_path.parent)
+    os.close(fd)
+    try:
+        shutil.copyfile(source_path, tmp_name)
+        shutil.copymode(source_path, tmp_name)  # mkstemp 默认 0600
+        os.replace(tmp_name, target_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
 def _package_path(*parts: str) -> Path:
     return Path(str(resources.files("autopaper").joinpath(*parts)))
 
@@ -489,8 +532,7 @@ def _check_imports(modules: Iterable[str]) -> tuple[int, int]:
 
 
 def _has_real_value(name: str, settings: RuntimeSettings) -> bool:
-    value = requests.utils.unquote(str(os.getenv(name, "")))
-    return bool(value) and not any(marker in value for marker in settings.feishu_env.placeholder_markers)
+    return settings.feishu_env.is_real_value(unquote(os.getenv(name, "")))
 
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -10,6 +12,11 @@ from omegaconf import DictConfig, OmegaConf
 
 from ..terminal import bullet_list
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML 未编译 libyaml 时退回纯 Python 实现
+    from yaml import SafeLoader as _YamlLoader
+
 PACKAGE_DIR = Path(__file__).resolve().parents[1]
 DEFAULT_CONFIG_DIR = PACKAGE_DIR / "config"
 
@@ -111,8 +118,16 @@ def to_plain_container(cfg: Any, *, resolve: bool = False) -> Any:
 
 
 def _read_yaml(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    # 批量同步时 default.yaml 会被每个配置重复读取；按修改时间和大小缓存解析结果，
+    # 返回深拷贝以免调用方修改缓存
+    stat = path.stat()
+    return copy.deepcopy(_parse_yaml(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=64)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
 
 
 def _load_declared_default_config(
@@ -120,6 +120,11 @@ class FeishuEnvPolicy:
             placeholder_markers=tuple(feishu_cfg.get("placeholder_markers", cls.placeholder_markers)),
         )
 
+    def is_real_value(self, value: Any) -> bool:
+        """Return True when ``value`` is set and is not a template placeholder."""
+        text = str(value or "")
+        return bool(text) and not any(marker in text for marker in self.placeholder_markers)
+
 
 @dataclass(frozen=True)
 class RuntimeSettings:
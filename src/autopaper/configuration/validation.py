@@ -221,5 +221,4 @@ def _parse_date(value: str) -> datetime | None:
 
 
 def _has_real_value(name: str, policy: FeishuEnvPolicy, configured_values: Mapping[str, Any]) -> bool:
-    value = str(os.getenv(name) or configured_values.get(name) or "")
-    return bool(value) and not any(marker in value for marker in policy.placeholder_markers)
+    return policy.is_real_value(os.getenv(name) or configured_values.get(name))
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 from ..terminal import info, key_values, section, table
-from .console import _paper_details
+from .console import _matched_interests_text, _paper_details
 
 
 class AdvancedDisplayMixin:
@@ -27,22 +27,28 @@ class AdvancedDisplayMixin:
 
         key_values("高级智能排序统计", stats)
 
-        # 分析评分分布
-        papers_with_breakdown = [p for p in papers if 'score_breakdown' in p]
-        if papers_with_breakdown:
-            base_scores = [p['score_breakdown'].get('base_score', 0) for p in papers_with_breakdown]
-            semantic_scores = [p['score_breakdown'].get('semantic_boost', 0) for p in papers_with_breakdown]
-            novelty_scores = [p['score_breakdown'].get('novelty_boost', 0) for p in papers_with_breakdown]
-            citation_scores = [p['score_breakdown'].get('citation_potential', 0) for p in papers_with_breakdown]
+        # 分析评分分布：单次遍历累加各维度得分
+        dimensions = (
+            ("基础匹配", 'base_score'),
+            ("语义增强", 'semantic_boost'),
+            ("新颖性", 'novelty_boost'),
+            ("引用潜力", 'citation_potential'),
+        )
+        totals = [0.0] * len(dimensions)
+        count = 0
+        for paper in papers:
+            breakdown = paper.get('score_breakdown')
+            if breakdown is None:
+                continue
+            count += 1
+            for index, (_, key) in enumerate(dimensions):
+                totals[index] += breakdown.get(key, 0)
+
+        if count:
             table(
                 "评分维度分析",
                 ["维度", "平均分"],
-                [
-                    ("基础匹配", sum(base_scores) / len(base_scores) if base_scores else 0),
-                    ("语义增强", sum(semantic_scores) / len(semantic_scores) if semantic_scores else 0),
-                    ("新颖性", sum(novelty_scores) / len(novelty_scores) if novelty_scores else 0),
-                    ("引用潜力", sum(citation_scores) / len(citation_scores) if citation_scores else 0),
-                ],
+                [(label, total / count) for (label, _), total in zip(dimensions, totals)],
             )
 
     def display_paper_score_breakdown(self, paper: Dict[str, Any]):
@@ -73,19 +79,19 @@ class AdvancedDisplayMixin:
 
         use_advanced = any('score_breakdown' in paper for paper in papers)
         score_key = 'final_score' if use_advanced else 'relevance_score'
+        score_label = "综合评分" if use_advanced else "相关性评分"
+        show_paper_breakdown = show_breakdown and use_advanced
 
         section(f"{'高级' if use_advanced else '标准'}智能排序论文", f"显示前 {min(max_display, len(papers))} 篇")
 
         for i, paper in enumerate(papers[:max_display], 1):
-            score = paper.get(score_key, 0)
-            matched_interests = paper.get('matched_interests', [])
-
-            details = {("综合评分" if use_advanced else "相关性评分"): f"{score:.2f}"}
-            if matched_interests:
-                details["匹配关键词"] = ", ".join(matched_interests)
+            details = {score_label: f"{paper.get(score_key, 0):.2f}"}
+            matched_text = _matched_interests_text(paper)
+            if matched_text:
+                details["匹配关键词"] = matched_text
 
             # 显示评分分解
-            if show_breakdown and use_advanced:
+            if show_paper_breakdown:
                 self.display_paper_score_breakdown(paper)
 
             details.update(_paper_details(paper))
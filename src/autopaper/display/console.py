@@ -6,6 +6,21 @@ from typing import Any, Dict, List
 
 from ..terminal import info, key_values, section, table
 
+_CATEGORY_NAMES = {
+    'cs.AI': '人工智能',
+    'cs.LG': '机器学习',
+    'cs.CV': '计算机视觉',
+    'cs.RO': '机器人学',
+    'cs.CL': '计算语言学',
+    'cs.CR': '密码学与安全',
+    'cs.NE': '神经与进化计算',
+    'cs.DB': '数据库',
+    'cs.HC': '人机交互',
+    'cs.IR': '信息检索',
+    'stat.ML': '机器学习(统计)',
+    'eess.IV': '图像和视频处理',
+}
+
 
 class ConsoleDisplayMixin:
     def display_hot_categories(self, papers: List[Dict[str, Any]]):
@@ -20,26 +35,11 @@ class ConsoleDisplayMixin:
 
         sorted_categories = sorted(category_count.items(), key=lambda x: x[1], reverse=True)[:10]
 
-        category_names = {
-            'cs.AI': '人工智能',
-            'cs.LG': '机器学习',
-            'cs.CV': '计算机视觉',
-            'cs.RO': '机器人学',
-            'cs.CL': '计算语言学',
-            'cs.CR': '密码学与安全',
-            'cs.NE': '神经与进化计算',
-            'cs.DB': '数据库',
-            'cs.HC': '人机交互',
-            'cs.IR': '信息检索',
-            'stat.ML': '机器学习(统计)',
-            'eess.IV': '图像和视频处理',
-        }
-
         table(
             "热门领域 Top 10",
             ["#", "分类", "名称", "论文数"],
             [
-                (index, category, category_names.get(category, category), count)
+                (index, category, _CATEGORY_NAMES.get(category, category), count)
                 for index, (category, count) in enumerate(sorted_categories, 1)
             ],
         )
@@ -53,13 +53,12 @@ class ConsoleDisplayMixin:
         section("智能排序论文", f"显示前 {min(max_display, len(papers))} 篇")
 
         for i, paper in enumerate(papers[:max_display], 1):
-            score = paper.get('relevance_score', 0)
-            matched_interests = paper.get('matched_interests', [])
             details = {}
             if show_scores:
-                details["相关性评分"] = f"{score:.2f}"
-                if matched_interests:
-                    details["匹配关键词"] = ", ".join(matched_interests)
+                details["相关性评分"] = f"{paper.get('relevance_score', 0):.2f}"
+                matched_text = _matched_interests_text(paper)
+                if matched_text:
+                    details["匹配关键词"] = matched_text
             details.update(_paper_details(paper))
             key_values(f"{i}. {paper.get('title', '')}", details)
 
@@ -105,7 +104,7 @@ class ConsoleDisplayMixin:
                 [
                     (
                         index,
-                        paper.get('title', '')[:80],
+                        _truncate(paper.get('title', ''), 80),
                         _exclude_reason_text(paper.get('exclude_reason', [])),
                     )
                     for index, paper in enumerate(excluded_papers[:5], 1)
@@ -117,9 +116,7 @@ class ConsoleDisplayMixin:
 def _paper_details(paper: Dict[str, Any]) -> dict[str, Any]:
     published = paper.get('published_date')
     published_text = published.strftime('%Y-%m-%d %H:%M') if published else "-"
-    summary = paper.get('summary', '')
-    if len(summary) > 240:
-        summary = summary[:240] + '...'
+    summary = _truncate(paper.get('summary', ''), 240)
     return {
         "作者": paper.get('authors_str', ''),
         "分类": paper.get('categories_str', ''),
@@ -130,6 +127,20 @@ def _paper_details(paper: Dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _matched_interests_text(paper: Dict[str, Any]) -> str:
+    matched_interests = paper.get('matched_interests')
+    if not matched_interests:
+        return ""
+    return ", ".join(matched_interests)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """超出长度时截断并追加省略号，短文本原样返回"""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + '...'
+
+
 def _exclude_reason_text(exclude_reason: Any) -> str:
     if isinstance(exclude_reason, list):
         exclude_reason = ', '.join(exclude_reason)
@@ -8,6 +8,26 @@ from typing import Any, Dict, List
 
 from ..terminal import print
 
+# Markdown 报告中每篇论文固定部分的模板，模板只解析一次，逐篇 format_map 填充
+_MD_PAPER_HEADER = (
+    "### {index}. {title}\n\n"
+    "| 项目 | 信息 |\n"
+    "|------|------|\n"
+    "| **ArXiv ID** | {arxiv_id} |\n"
+    "| **作者** | {authors} |\n"
+    "| **分类** | {categories} |\n"
+    "| **发布日期** | {published} |\n"
+)
+_SCORE_BREAKDOWN_KEYS = ('base_score', 'semantic_boost', 'author_boost', 'novelty_boost', 'citation_potential')
+_MD_SCORE_BREAKDOWN = (
+    "**评分详情**:\n"
+    "- 基础匹配: {base_score:.2f}\n"
+    "- 语义增强: {semantic_boost:.2f}\n"
+    "- 作者分析: {author_boost:.2f}\n"
+    "- 新颖性: {novelty_boost:.2f}\n"
+    "- 引用潜力: {citation_potential:.2f}\n\n"
+)
+
 
 class ReportWriterMixin:
     def save_papers_report(
@@ -165,87 +185,95 @@ class ReportWriterMixin:
         filename = "_".join(name_parts) + ".md"
         filepath = output_path / filename
 
+        parts: List[str] = []
+        write = parts.append
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # 写入标题和基本信息
-                f.write("# ArXiv 论文采集报告\n\n")
-                f.write(f"- **生成时间**: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}\n")
-                f.write(f"- **配置文件**: {config_name}\n")
-                if research_area and research_area != config_name:
-                    f.write(f"- **研究领域**: {research_area}\n")
-                f.write(f"- **搜索领域**: {field_name}\n")
-                f.write(f"- **时间范围**: 最近{days}天\n")
-                f.write(f"- **论文数量**: {len(papers)}篇\n")
-                f.write("\n---\n\n")
-
-                # 统计信息
+            # 写入标题和基本信息
+            write("# ArXiv 论文采集报告\n\n")
+            write(f"- **生成时间**: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}\n")
+            write(f"- **配置文件**: {config_name}\n")
+            if research_area and research_area != config_name:
+                write(f"- **研究领域**: {research_area}\n")
+            write(f"- **搜索领域**: {field_name}\n")
+            write(f"- **时间范围**: 最近{days}天\n")
+            write(f"- **论文数量**: {len(papers)}篇\n")
+            write("\n---\n\n")
+
+            # 统计信息
+            if include_scores:
+                # 单次遍历同时统计最高、最低与总分
+                score_max = float('-inf')
+                score_min = float('inf')
+                score_sum = 0.0
+                for p in papers:
+                    value = p.get('final_score', p.get('relevance_score', 0))
+                    score_sum += value
+                    if value > score_max:
+                        score_max = value
+                    if value < score_min:
+                        score_min = value
+                write("## 📊 统计信息\n\n")
+                write(f"- **最高评分**: {score_max:.2f}\n")
+                write(f"- **最低评分**: {score_min:.2f}\n")
+                write(f"- **平均评分**: {score_sum / len(papers):.2f}\n\n")
+
+            # 论文列表
+            write("## 📚 论文列表\n\n")
+
+            for i, paper in enumerate(papers, 1):
+                arxiv_id = paper.get('arxiv_id', 'N/A')
+
+                # 标题和基本信息表格
+                write(
+                    _MD_PAPER_HEADER.format_map(
+                        {
+                            'index': i,
+                            'title': paper.get('title', 'Unknown Title'),
+                            'arxiv_id': arxiv_id,
+                            'authors': paper.get('authors_str', 'Unknown Authors'),
+                            'categories': paper.get('categories_str', 'N/A'),
+                            'published': paper.get('published_date', 'N/A'),
+                        }
+                    )
+                )
+
+                # 评分信息
                 if include_scores:
-                    scores = [p.get('final_score', p.get('relevance_score', 0)) for p in papers]
-                    if scores:
-                        f.write("## 📊 统计信息\n\n")
-                        f.write(f"- **最高评分**: {max(scores):.2f}\n")
-                        f.write(f"- **最低评分**: {min(scores):.2f}\n")
-                        f.write(f"- **平均评分**: {sum(scores)/len(scores):.2f}\n\n")
-
-                # 论文列表
-                f.write("## 📚 论文列表\n\n")
-
-                for i, paper in enumerate(papers, 1):
-                    # 标题和基本信息
-                    title = paper.get('title', 'Unknown Title')
-                    authors = paper.get('authors_str', 'Unknown Authors')
-                    arxiv_id = paper.get('arxiv_id', 'N/A')
-                    categories = paper.get('categories_str', 'N/A')
-                    published = paper.get('published_date', 'N/A')
-
-                    f.write(f"### {i}. {title}\n\n")
-
-                    # 基本信息表格
-                    f.write("| 项目 | 信息 |\n")
-                    f.write("|------|------|\n")
-                    f.write(f"| **ArXiv ID** | {arxiv_id} |\n")
-                    f.write(f"| **作者** | {authors} |\n")
-                    f.write(f"| **分类** | {categories} |\n")
-                    f.write(f"| **发布日期** | {published} |\n")
-
-                    # 评分信息
-                    if include_scores:
-                        score = paper.get('final_score', paper.get('relevance_score', 0))
-                        f.write(f"| **相关性评分** | {score:.2f} |\n")
-
-                        if 'matched_interests' in paper:
-                            matched = ', '.join(paper['matched_interests'])
-                            f.write(f"| **匹配关键词** | {matched} |\n")
-
-                    # 链接
-                    paper_url = paper.get('paper_url', '')
-                    pdf_url = paper.get('pdf_url', '')
-                    if paper_url:
-                        f.write(f"| **论文链接** | [{arxiv_id}]({paper_url}) |\n")
-                    if pdf_url:
-                        f.write(f"| **PDF下载** | [PDF]({pdf_url}) |\n")
-
-                    f.write("\n")
-
-                    # 摘要
-                    summary = paper.get('summary', 'No summary available')
-                    f.write(f"**摘要**: {summary}\n\n")
-
-                    # 评分详情（如果启用了高级评分）
-                    if include_scores and 'score_breakdown' in paper:
-                        breakdown = paper['score_breakdown']
-                        f.write("**评分详情**:\n")
-                        f.write(f"- 基础匹配: {breakdown.get('base_score', 0):.2f}\n")
-                        f.write(f"- 语义增强: {breakdown.get('semantic_boost', 0):.2f}\n")
-                        f.write(f"- 作者分析: {breakdown.get('author_boost', 0):.2f}\n")
-                        f.write(f"- 新颖性: {breakdown.get('novelty_boost', 0):.2f}\n")
-                        f.write(f"- 引用潜力: {breakdown.get('citation_potential', 0):.2f}\n\n")
-
-                    f.write("---\n\n")
-
-                # 页脚
-                f.write("\n*报告由 ArXiv 论文采集工具生成*\n")
-
+                    score = paper.get('final_score', paper.get('relevance_score', 0))
+                    write(f"| **相关性评分** | {score:.2f} |\n")
+
+                    if 'matched_interests' in paper:
+                        matched = ', '.join(paper['matched_interests'])
+                        write(f"| **匹配关键词** | {matched} |\n")
+
+                # 链接
+                paper_url = paper.get('paper_url', '')
+                pdf_url = paper.get('pdf_url', '')
+                if paper_url:
+                    write(f"| **论文链接** | [{arxiv_id}]({paper_url}) |\n")
+                if pdf_url:
+                    write(f"| **PDF下载** | [PDF]({pdf_url}) |\n")
+
+                # 摘要
+                summary = paper.get('summary', 'No summary available')
+                write(f"\n**摘要**: {summary}\n\n")
+
+                # 评分详情（如果启用了高级评分）
+                if include_scores and 'score_breakdown' in paper:
+                    breakdown = paper['score_breakdown']
+                    write(
+                        _MD_SCORE_BREAKDOWN.format_map(
+                            {key: breakdown.get(key, 0) for key in _SCORE_BREAKDOWN_KEYS}
+                        )
+                    )
+
+                write("---\n\n")
+
+            # 页脚
+            write("\n*报告由 ArXiv 论文采集工具生成*\n")
+
+            filepath.write_bytes("".join(parts).encode('utf-8'))
             print(f"💾 Markdown报告已保存到: {filepath}")
 
         except Exception as e:
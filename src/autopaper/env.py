@@ -0,0 +1,16 @@
+"""Process-wide ``.env`` loading helpers."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def load_default_env() -> bool:
+    """按 python-dotenv 默认规则加载 ``.env``，同一进程内只解析一次
+
+    不覆盖已存在的环境变量，因此在 CLI 通过 ``--env-file`` 显式加载后再调用也是安全的。
+    """
+    return load_dotenv()
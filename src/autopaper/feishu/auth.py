@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 
@@ -11,14 +11,19 @@ from ..terminal import debug, print
 from .config import FeishuBitableConfig
 from .errors import FeishuBitableAPIError
 
+# 进程内 tenant_access_token 缓存: (base_url, app_id) -> (token, 过期时间 monotonic 秒)
+_TENANT_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+# 距离过期不足该秒数时视为失效，提前刷新
+_TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
 
 class FeishuAuthMixin:
     def _create_config_from_env(self) -> FeishuBitableConfig:
         """从环境变量创建配置"""
         import os
-        from dotenv import load_dotenv
+        from ..env import load_default_env
 
-        load_dotenv()
+        load_default_env()
 
         return FeishuBitableConfig(
             app_id=os.getenv('FEISHU_APP_ID', ''),
@@ -28,15 +33,40 @@ class FeishuAuthMixin:
             app_token=os.getenv('FEISHU_BITABLE_APP_TOKEN', ''),
         )
 
+    def _cached_tenant_access_token(self) -> Optional[str]:
+        """返回本进程内仍在有效期内的 tenant_access_token"""
+        cached = _TENANT_TOKEN_CACHE.get((self.config.base_url, self.config.app_id))
+        if cached is None:
+            return None
+        token, expires_at = cached
+        if time.monotonic() >= expires_at - _TOKEN_EXPIRY_MARGIN_SECONDS:
+            return None
+        return token
+
+    def _forget_cached_tenant_access_token(self, token: Optional[str]) -> None:
+        """服务端判定 token 已过期时，将其从进程内缓存移除"""
+        key = (self.config.base_url, self.config.app_id)
+        cached = _TENANT_TOKEN_CACHE.get(key)
+        if cached is not None and cached[0] == token:
+            _TENANT_TOKEN_CACHE.pop(key, None)
+
     def get_tenant_access_token(self) -> str:
         """获取应用访问令牌 (tenant_access_token)
 
+        同一进程内按 (base_url, app_id) 复用未过期的令牌；若缓存令牌恰好是
+        当前正在使用（刚被服务端判定过期）的令牌，则重新请求。
+
         Returns:
             应用访问令牌字符串
         """
         if not self.config.app_id or not self.config.app_secret:
             raise FeishuBitableAPIError("获取tenant_access_token需要app_id和app_secret")
 
+        cached_token = self._cached_tenant_access_token()
+        if cached_token and cached_token != self.config.tenant_access_token:
+            debug("♻️ 复用缓存的 tenant_access_token")
+            return cached_token
+
         payload = {"app_id": self.config.app_id, "app_secret": self.config.app_secret}
 
         endpoint = "auth/v3/tenant_access_token/internal"
@@ -55,6 +85,11 @@ class FeishuAuthMixin:
                 expires_in = result.get('expire')
 
                 debug(f"✅ 成功获取 tenant_access_token，有效期: {expires_in} 秒")
+                if tenant_access_token and expires_in:
+                    _TENANT_TOKEN_CACHE[(self.config.base_url, self.config.app_id)] = (
+                        tenant_access_token,
+                        time.monotonic() + float(expires_in),
+                    )
                 return tenant_access_token
             else:
                 raise FeishuBitableAPIError(
@@ -72,10 +107,13 @@ class FeishuAuthMixin:
         """
         if self.config.token_type == "tenant" and self.config.app_id and self.config.app_secret:
             try:
+                # 当前 session 使用的令牌可能来自缓存，已被判定过期就不能再复用
+                self._forget_cached_tenant_access_token(self._session_token)
                 new_token = self.get_tenant_access_token()
                 self.config.tenant_access_token = new_token
 
                 # 更新session header
+                self._session_token = new_token
                 self.session.headers.update({'Authorization': f'Bearer {new_token}'})
 
                 return True
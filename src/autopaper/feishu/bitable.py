@@ -39,10 +39,18 @@ class FeishuBitableConnector(
             config = self._create_config_from_env()
 
         self.config = config
+        access_token = config.access_token
+        if config.token_type == "tenant" and config.app_id:
+            # 批量同步时复用前一个连接器刷新得到的令牌，避免每个配置都先撞上过期令牌；
+            # 令牌只放在本连接器的 session 上，不改写调用方传入的 config
+            access_token = self._cached_tenant_access_token() or access_token
+        self._session_token = access_token
         self.session = requests.Session()
         self.session.headers.update(
-            {'Content-Type': 'application/json; charset=utf-8', 'Authorization': f'Bearer {config.access_token}'}
+            {'Content-Type': 'application/json; charset=utf-8', 'Authorization': f'Bearer {access_token}'}
         )
+        # 字段名称 -> 字段ID 映射，按 table_id 缓存，创建多个视图时只需请求一次字段列表
+        self._field_mapping_cache = {}
 
         debug(f"🔑 使用 {config.token_type}_access_token 进行API认证")
 
@@ -26,12 +26,10 @@ class FeishuBitableConfig:
             raise ValueError("必须提供 user_access_token 或 tenant_access_token 之一")
 
         # 优先使用有效的token，而不是优先使用user_access_token
-        # 如果user_access_token是占位符，则清空它
-        if self.user_access_token and ('xxxx' in self.user_access_token or len(self.user_access_token) < 20):
+        # 占位符或长度明显不足的token一律清空
+        if not _is_real_token(self.user_access_token):
             self.user_access_token = None
-
-        # 如果tenant_access_token是占位符，则清空它
-        if self.tenant_access_token and ('xxxx' in self.tenant_access_token or len(self.tenant_access_token) < 20):
+        if not _is_real_token(self.tenant_access_token):
             self.tenant_access_token = None
 
         # 重新检查是否有有效token
@@ -71,3 +69,8 @@ class FeishuBitableConfig:
             max_retries=api_cfg.get('max_retries', 3),
             retry_delay=api_cfg.get('retry_delay', 1.0),
         )
+
+
+def _is_real_token(token: Optional[str]) -> bool:
+    """令牌非空、不是模板占位符且长度合理"""
+    return bool(token) and 'xxxx' not in token and len(token) >= 20
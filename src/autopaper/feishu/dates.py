@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 FEISHU_DATE_TIMEZONE = timezone(timedelta(hours=8))
@@ -24,14 +25,25 @@ def to_feishu_timestamp_millis(value: Any) -> int | None:
         return int(dt.timestamp() * 1000)
 
     if isinstance(value, date):
-        dt = datetime.combine(value, time.min, tzinfo=FEISHU_DATE_TIMEZONE)
-        return int(dt.timestamp() * 1000)
+        return _calendar_date_millis(value)
 
     if isinstance(value, str):
-        try:
-            dt = datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=FEISHU_DATE_TIMEZONE)
-        except ValueError:
-            return None
-        return int(dt.timestamp() * 1000)
+        return _date_string_millis(value)
 
     return None
+
+
+@lru_cache(maxsize=1024)
+def _calendar_date_millis(value: date) -> int:
+    # A sync batch usually spans only a few calendar days, so cache per date.
+    dt = datetime.combine(value, time.min, tzinfo=FEISHU_DATE_TIMEZONE)
+    return int(dt.timestamp() * 1000)
+
+
+@lru_cache(maxsize=1024)
+def _date_string_millis(value: str) -> int | None:
+    try:
+        parsed = datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+    return _calendar_date_millis(parsed)
@@ -29,6 +29,7 @@ class FeishuFieldMixin:
 
         endpoint = f"bitable/v1/apps/{self.config.app_token}/tables/{table_id}/fields"
         result = self._make_request('POST', endpoint, json=payload)
+        self._field_mapping_cache.pop(table_id, None)
 
         return result
 
@@ -41,6 +42,10 @@ class FeishuFieldMixin:
         Returns:
             字段名称到字段ID的映射字典
         """
+        cached = self._field_mapping_cache.get(table_id)
+        if cached is not None:
+            return cached
+
         try:
             endpoint = f"bitable/v1/apps/{self.config.app_token}/tables/{table_id}/fields"
             fields_result = self._make_request('GET', endpoint)
@@ -54,6 +59,7 @@ class FeishuFieldMixin:
                 if field_id and field_name:
                     field_mapping[field_name] = field_id
 
+            self._field_mapping_cache[table_id] = field_mapping
             return field_mapping
 
         except Exception as e:
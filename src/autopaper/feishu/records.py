@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 
 class FeishuRecordMixin:
@@ -33,6 +33,62 @@ class FeishuRecordMixin:
 
         return all_records
 
+    def count_records(self, table_id: str) -> int:
+        """返回数据表记录总数（只取一条记录，读取响应中的 total）"""
+        endpoint = f"bitable/v1/apps/{self.config.app_token}/tables/{table_id}/records"
+        result = self._make_request('GET', endpoint, params={"page_size": 1})
+        return int((result or {}).get('total') or 0)
+
+    def search_records_by_field(
+        self,
+        table_id: str,
+        field_name: str,
+        values: Iterable[str],
+        chunk_size: int = 50,
+        page_size: int = 500,
+    ) -> List[Dict[str, Any]]:
+        """按字段取值在服务端筛选记录，只返回命中的记录
+
+        Args:
+            table_id: 表格ID
+            field_name: 筛选字段名，如 "ArXiv ID"
+            values: 需要匹配的取值，按 chunk_size 分组以 OR 条件查询
+            chunk_size: 每次查询的条件数量上限
+            page_size: 每页记录数
+
+        Returns:
+            命中的记录列表（仅包含 field_name 字段）
+        """
+        endpoint = f"bitable/v1/apps/{self.config.app_token}/tables/{table_id}/records/search"
+        values = [value for value in dict.fromkeys(values) if value]
+        matched_records: List[Dict[str, Any]] = []
+
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start : start + chunk_size]
+            payload = {
+                "field_names": [field_name],
+                "filter": {
+                    "conjunction": "or",
+                    "conditions": [{"field_name": field_name, "operator": "is", "value": [value]} for value in chunk],
+                },
+            }
+            page_token = None
+            while True:
+                params = {"page_size": page_size}
+                if page_token:
+                    params["page_token"] = page_token
+
+                result = self._make_request('POST', endpoint, params=params, json=payload)
+                if not result:
+                    break
+
+                matched_records.extend(result.get('items') or [])
+                page_token = result.get('page_token')
+                if not result.get('has_more') or not page_token:
+                    break
+
+        return matched_records
+
     def insert_record(self, table_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
         """向数据表插入新记录
 
@@ -5,8 +5,7 @@ from __future__ import annotations
 import os
 from typing import Any
 
-from dotenv import load_dotenv
-
+from ..env import load_default_env
 from ..terminal import debug, error, info, key_values, print, success, table, warning
 from .bitable import FeishuBitableConnector
 from .config import FeishuBitableConfig
@@ -20,7 +19,7 @@ def sync_papers_to_feishu(papers, cfg, matched_keywords_map=None, score_map=None
     Returns a structured result so callers can distinguish a clean no-op from
     partial write failures.
     """
-    load_dotenv()
+    load_default_env()
 
     feishu_cfg = cfg.get("feishu", {})
     if not feishu_cfg.get("enabled", False):
@@ -66,10 +65,13 @@ def sync_papers_to_feishu(papers, cfg, matched_keywords_map=None, score_map=None
         result.table_id = target_table_id
 
         debug("🔍 检查现有记录，避免重复...")
-        existing_records = connector.get_all_records(target_table_id)
-        existing_arxiv_ids = _extract_existing_arxiv_ids(existing_records)
-        result.total_existing = len(existing_arxiv_ids)
-        debug(f"📋 发现 {len(existing_arxiv_ids)} 条现有记录")
+        # 只在服务端查询本次候选论文的 ArXiv ID，避免拉取整张表
+        candidate_ids = {_paper_arxiv_id(_paper_fields(paper)) for paper in papers}
+        candidate_ids.discard("")
+        existing_records = connector.search_records_by_field(target_table_id, "ArXiv ID", sorted(candidate_ids))
+        existing_arxiv_ids = _extract_existing_arxiv_ids(existing_records) & candidate_ids
+        result.total_existing = connector.count_records(target_table_id)
+        debug(f"📋 数据表现有 {result.total_existing} 条记录，其中 {len(existing_arxiv_ids)} 篇与本次候选重复")
 
         sync_threshold = float(feishu_cfg.get("sync_threshold", 0.0))
         new_papers_data, skipped_existing, skipped_threshold = _prepare_papers_for_sync(
@@ -115,7 +117,7 @@ def sync_papers_to_feishu(papers, cfg, matched_keywords_map=None, score_map=None
                     research_area,
                     result.synced_count,
                     result.failed_count,
-                    len(existing_arxiv_ids) + result.synced_count,
+                    result.total_existing + result.synced_count,
                 )
             ],
         )
@@ -164,25 +166,28 @@ def _resolve_table_context(cfg) -> tuple[str, str, str]:
     return table_display_name, str(research_area), str(field_name)
 
 
-def _extract_existing_arxiv_ids(records: list[dict[str, Any]]) -> set[str]:
-    existing_arxiv_ids = set()
-    for record in records:
-        fields = record.get("fields", {})
-        arxiv_id_field = fields.get("ArXiv ID", "")
-        if isinstance(arxiv_id_field, dict):
-            arxiv_id = arxiv_id_field.get("text", "")
-        else:
-            arxiv_id = str(arxiv_id_field) if arxiv_id_field else ""
-        if arxiv_id:
-            existing_arxiv_ids.add(arxiv_id)
-    return existing_arxiv_ids
+def _extract_existing_arxiv_ids(records: list[dict[str, Any]]) -> frozenset[str]:
+    existing_arxiv_ids = frozenset(_record_arxiv_id(record) for record in records)
+    return existing_arxiv_ids - {""}
+
+
+def _record_arxiv_id(record: dict[str, Any]) -> str:
+    arxiv_id_field = record.get("fields", {}).get("ArXiv ID", "")
+    if isinstance(arxiv_id_field, dict):
+        return arxiv_id_field.get("text", "")
+    if isinstance(arxiv_id_field, list):
+        # 记录查询接口将文本字段返回为富文本片段列表
+        return "".join(
+            str(segment.get("text", "")) if isinstance(segment, dict) else str(segment) for segment in arxiv_id_field
+        )
+    return str(arxiv_id_field) if arxiv_id_field else ""
 
 
 def _prepare_papers_for_sync(
     papers,
     *,
     research_area: str,
-    existing_arxiv_ids: set[str],
+    existing_arxiv_ids: frozenset[str],
     sync_threshold: float,
     matched_keywords_map=None,
     score_map=None,
@@ -192,12 +197,13 @@ def _prepare_papers_for_sync(
     skipped_threshold = 0
 
     for paper in papers:
-        arxiv_id = _paper_value(paper, "arxiv_id", _paper_value(paper, "id", ""))
+        fields = _paper_fields(paper)
+        arxiv_id = _paper_arxiv_id(fields)
         if arxiv_id in existing_arxiv_ids:
             skipped_existing += 1
             continue
 
-        relevance_score = _paper_score(paper)
+        relevance_score = _paper_score(fields)
         if score_map and arxiv_id in score_map:
             relevance_score = score_map[arxiv_id]
 
@@ -207,11 +213,11 @@ def _prepare_papers_for_sync(
 
         papers_to_sync.append(
             _build_record_fields(
-                paper,
+                fields,
                 arxiv_id=arxiv_id,
                 research_area=research_area,
                 relevance_score=relevance_score,
-                matched_keywords=_matched_keywords(paper, arxiv_id, matched_keywords_map),
+                matched_keywords=_matched_keywords(fields, arxiv_id, matched_keywords_map),
             )
         )
 
@@ -219,31 +225,31 @@ def _prepare_papers_for_sync(
 
 
 def _build_record_fields(
-    paper,
+    fields,
     *,
     arxiv_id: str,
     research_area: str,
     relevance_score: float,
     matched_keywords: list[str],
 ) -> dict[str, Any]:
-    title = _paper_value(paper, "title", "")
-    summary = _paper_value(paper, "summary", "")
-    paper_url = _paper_value(paper, "paper_url", _paper_value(paper, "entry_id", ""))
-    pdf_url = _paper_value(paper, "pdf_url", "")
-    published_date = _paper_value(paper, "published_date", None)
-    updated_date = _paper_value(paper, "updated_date", None)
+    title = fields.get("title", "")
+    summary = fields.get("summary", "")
+    paper_url = _first_value(fields, ("paper_url", "entry_id"), "")
+    pdf_url = fields.get("pdf_url", "")
+    published_date = fields.get("published_date")
+    updated_date = fields.get("updated_date")
 
     return {
         "ArXiv ID": {"text": arxiv_id, "link": paper_url} if paper_url else arxiv_id,
         "标题": title,
-        "作者": _string_list(_paper_value(paper, "authors", []), limit=10),
+        "作者": _string_list(fields.get("authors", []), limit=10),
         "摘要": summary[:1000] if summary else "",
-        "分类": _string_list(_paper_value(paper, "categories", []), limit=5),
+        "分类": _string_list(fields.get("categories", []), limit=5),
         "匹配关键词": _string_list(matched_keywords, limit=10),
         "相关性评分": round(float(relevance_score), 2),
         "研究领域": _string_list(research_area, limit=3),
         "PDF链接": {"text": "PDF", "link": pdf_url} if pdf_url else None,
-        "必须关键词匹配": _string_list(_paper_value(paper, "required_keyword_matches", []), limit=5),
+        "必须关键词匹配": _string_list(fields.get("required_keyword_matches", []), limit=5),
         "发布日期": _timestamp_millis(published_date),
         "更新日期": _timestamp_millis(updated_date),
     }
@@ -324,7 +330,7 @@ def _notify_if_enabled(
     field_name: str,
     table_display_name: str,
     table_id: str,
-    existing_arxiv_ids: set[str],
+    existing_arxiv_ids: frozenset[str],
     sync_threshold: float,
     result: FeishuSyncResult,
 ) -> None:
@@ -381,15 +387,17 @@ def _notify_if_enabled(
 
 def _notification_papers(
     papers,
-    existing_arxiv_ids: set[str],
+    existing_arxiv_ids: frozenset[str],
     sync_threshold: float,
     *,
     limit: int,
 ) -> list[dict[str, Any]]:
     notification_papers = []
     for paper in papers:
-        arxiv_id = _paper_value(paper, "arxiv_id", _paper_value(paper, "id", ""))
-        if arxiv_id in existing_arxiv_ids or _paper_score(paper) < sync_threshold:
+        fields = _paper_fields(paper)
+        arxiv_id = _paper_arxiv_id(fields)
+        relevance_score = _paper_score(fields)
+        if arxiv_id in existing_arxiv_ids or relevance_score < sync_threshold:
             continue
         if isinstance(paper, dict):
             payload = paper.copy()
@@ -397,13 +405,13 @@ def _notification_papers(
             if summary:
                 payload["summary"] = summary[:200] + "..." if len(summary) > 200 else summary
         else:
-            summary = _paper_value(paper, "summary", "")
+            summary = fields.get("summary", "")
             payload = {
-                "title": _paper_value(paper, "title", ""),
+                "title": fields.get("title", ""),
                 "arxiv_id": arxiv_id,
-                "authors_str": ", ".join(_string_list(_paper_value(paper, "authors", []))),
-                "paper_url": _paper_value(paper, "paper_url", _paper_value(paper, "entry_id", "")),
-                "relevance_score": _paper_score(paper),
+                "authors_str": ", ".join(_string_list(fields.get("authors", []))),
+                "paper_url": _first_value(fields, ("paper_url", "entry_id"), ""),
+                "relevance_score": relevance_score,
                 "summary": summary[:200] + "..." if summary else "",
             }
         notification_papers.append(payload)
@@ -412,47 +420,65 @@ def _notification_papers(
     return notification_papers
 
 
-def _matched_keywords(paper, arxiv_id: str, matched_keywords_map=None) -> list[str]:
-    matched_keywords = _paper_value(
-        paper,
-        "matched_interests",
-        _paper_value(paper, "matched_keywords", []),
-    )
+def _matched_keywords(fields, arxiv_id: str, matched_keywords_map=None) -> list[str]:
+    matched_keywords = _first_value(fields, ("matched_interests", "matched_keywords"), [])
     if matched_keywords_map and arxiv_id in matched_keywords_map:
         matched_keywords = matched_keywords_map[arxiv_id]
     return _string_list(matched_keywords)
 
 
-def _paper_score(paper) -> float:
-    return float(
-        _paper_value(
-            paper,
-            "final_score",
-            _paper_value(
-                paper,
-                "relevance_score",
-                _paper_value(paper, "score", 0),
-            ),
-        )
-        or 0
-    )
+def _paper_score(fields) -> float:
+    return float(_first_value(fields, ("final_score", "relevance_score", "score"), 0) or 0)
+
+
+def _paper_arxiv_id(fields) -> str:
+    return _first_value(fields, ("arxiv_id", "id"), "")
+
 
+class _PaperAttributes:
+    """把论文对象包装成只读映射，使对象与字典共用同一套取值逻辑"""
 
-def _paper_value(paper, name: str, default=None):
-    if isinstance(paper, dict):
-        return paper.get(name, default)
-    return getattr(paper, name, default)
+    __slots__ = ("_paper",)
+
+    def __init__(self, paper):
+        self._paper = paper
+
+    def __contains__(self, name: str) -> bool:
+        return hasattr(self._paper, name)
+
+    def get(self, name: str, default=None):
+        return getattr(self._paper, name, default)
+
+
+def _paper_fields(paper):
+    """每篇论文只判断一次类型：字典原样返回，其他对象按属性读取"""
+    return paper if isinstance(paper, dict) else _PaperAttributes(paper)
+
+
+def _first_value(fields, names: tuple[str, ...], default=None):
+    """按顺序返回第一个存在的字段值，不再预先求值各级回退默认值"""
+    for name in names:
+        if name in fields:
+            return fields.get(name)
+    return default
 
 
 def _string_list(value, *, limit: int | None = None) -> list[str]:
     if value is None:
-        values: list[Any] = []
-    elif isinstance(value, list | tuple | set):
-        values = list(value)
-    else:
-        values = str(value).split(",")
-    cleaned = [str(item).strip() for item in values if item is not None and str(item).strip()]
-    return cleaned[:limit] if limit else cleaned
+        return []
+    values = value if isinstance(value, list | tuple | set) else str(value).split(",")
+    cleaned: list[str] = []
+    for item in values:
+        if item is None:
+            continue
+        text = str(item).strip()
+        if not text:
+            continue
+        cleaned.append(text)
+        # 达到上限即停止，长作者列表无需逐个处理
+        if limit and len(cleaned) >= limit:
+            break
+    return cleaned
 
 
 def _timestamp_millis(value) -> int | None:
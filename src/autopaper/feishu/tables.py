@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..terminal import print
 
+# 进程内数据表名称索引: (base_url, app_token) -> {表名: table_id}
+_TABLE_ID_CACHE: Dict[Tuple[str, str], Dict[str, str]] = {}
+
 
 class FeishuTableMixin:
     def create_table(self, table_name: str, fields: List[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -26,6 +29,7 @@ class FeishuTableMixin:
 
         endpoint = f"bitable/v1/apps/{self.config.app_token}/tables"
         result = self._make_request('POST', endpoint, json=payload)
+        _TABLE_ID_CACHE.pop(self._table_cache_key(), None)
 
         return result
 
@@ -110,12 +114,26 @@ class FeishuTableMixin:
         return result
 
     def find_table_by_name(self, table_name: str) -> Optional[str]:
-        """根据表格名称查找表格ID"""
-        tables = self.list_tables()
-        for table in tables:
-            if table.get('name') == table_name:
-                return table.get('table_id')
-        return None
+        """根据表格名称查找表格ID
+
+        表名索引在进程内按多维表格缓存，批量同步多个配置时只需列一次数据表；
+        未命中时重新拉取一次，以兼容在别处新建的表格。
+        """
+        cached = _TABLE_ID_CACHE.get(self._table_cache_key())
+        if cached is not None and table_name in cached:
+            return cached[table_name]
+        return self._refresh_table_ids().get(table_name)
+
+    def _table_cache_key(self) -> Tuple[str, str]:
+        return (self.config.base_url, self.config.app_token)
+
+    def _refresh_table_ids(self) -> Dict[str, str]:
+        table_ids: Dict[str, str] = {}
+        for table in self.list_tables():
+            # 与逐个遍历一致：同名表格取第一个
+            table_ids.setdefault(table.get('name'), table.get('table_id'))
+        _TABLE_ID_CACHE[self._table_cache_key()] = table_ids
+        return table_ids
 
     def setup_paper_sync_tables(self):
         """设置论文同步所需的数据表
@@ -2,11 +2,12 @@
 """Feishu tenant_access_token helpers."""
 
 import os
+import tempfile
 from pathlib import Path
 
 import requests
-from dotenv import load_dotenv
 
+from ..env import load_default_env
 from ..terminal import error, info, key_values, panel, print, success
 
 
@@ -21,7 +22,7 @@ def get_tenant_access_token(app_id: str = None, app_secret: str = None, base_url
         包含token信息的字典
     """
     # 从环境变量获取配置
-    load_dotenv()
+    load_default_env()
 
     if not app_id:
         app_id = os.getenv('FEISHU_APP_ID')
@@ -85,22 +86,34 @@ def update_env_file(tenant_access_token: str, env_file: str = '.env') -> bool:
             lines = []
 
         # 查找并更新FEISHU_TENANT_ACCESS_TOKEN行
+        new_line = f'FEISHU_TENANT_ACCESS_TOKEN={tenant_access_token}\n'
         updated = False
         for i, line in enumerate(lines):
             if line.strip().startswith('FEISHU_TENANT_ACCESS_TOKEN='):
-                lines[i] = f'FEISHU_TENANT_ACCESS_TOKEN={tenant_access_token}\n'
+                if line.strip() == new_line.strip():
+                    # 令牌未变化，无需重写文件
+                    env_path.chmod(0o600)
+                    return True
+                lines[i] = new_line
                 updated = True
                 break
 
         # 如果没有找到，添加新行
         if not updated:
-            lines.append(f'FEISHU_TENANT_ACCESS_TOKEN={tenant_access_token}\n')
-
-        # 写回文件
-        with env_path.open('w', encoding='utf-8') as f:
-            f.writelines(lines)
-
-        env_path.chmod(0o600)
+            if lines and not lines[-1].endswith('\n'):
+                lines[-1] += '\n'
+            lines.append(new_line)
+
+        # 先写入同目录临时文件再原子替换，避免中途失败留下被截断的.env
+        fd, tmp_name = tempfile.mkstemp(prefix=f'.{env_path.name}.', suffix='.tmp', dir=env_path.parent)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            os.chmod(tmp_name, 0o600)
+            os.replace(tmp_name, env_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
         return True
 
     except Exception as e:
@@ -128,7 +141,7 @@ def main(
     """Fetch and optionally persist a tenant access token."""
     panel("Feishu Token", "飞书应用访问令牌获取工具", style="cyan")
 
-    load_dotenv()
+    load_default_env()
     app_id = app_id or os.getenv('FEISHU_APP_ID')
     app_secret = app_secret or os.getenv('FEISHU_APP_SECRET')
 
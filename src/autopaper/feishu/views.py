@@ -4,7 +4,26 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from ..terminal import debug, print
+from ..terminal import debug, is_verbose, print
+
+# 自动清理时保留的默认视图
+_DEFAULT_VIEW_NAMES = frozenset({'表格视图', 'Grid View', '默认视图'})
+
+# 配置中的操作符 -> 飞书API操作符
+_COMPARISON_OPERATORS = {
+    'gte': 'isGreaterThanOrEqualTo',
+    'lte': 'isLessThanOrEqualTo',
+    'gt': 'isGreaterThan',
+    'lt': 'isLessThan',
+    'eq': 'is',
+    'contains': 'contains',
+    'not_contains': 'doesNotContain',
+}
+_FEISHU_OPERATORS = {
+    **_COMPARISON_OPERATORS,
+    'is_empty': 'isEmpty',
+    'is_not_empty': 'isNotEmpty',
+}
 
 
 class FeishuViewMixin:
@@ -53,8 +72,10 @@ class FeishuViewMixin:
             # 获取字段映射
             field_mapping = self._get_field_mapping(table_id)
             debug(f"     🔍 字段映射获取结果: {len(field_mapping)} 个字段")
-            for field_name, field_id in field_mapping.items():
-                debug(f"       - {field_name}: {field_id}")
+            # 逐字段输出及下方的 payload/响应转储只在 --verbose 下构造，避免为被丢弃的日志格式化大对象
+            if is_verbose():
+                for field_name, field_id in field_mapping.items():
+                    debug(f"       - {field_name}: {field_id}")
 
             # 构建视图属性
             view_property = {}
@@ -91,11 +112,13 @@ class FeishuViewMixin:
             if view_property:
                 # 按照飞书API格式构建请求
                 update_payload = {"property": view_property}
-                debug(f"     🔧 更新视图属性payload: {update_payload}")
+                if is_verbose():
+                    debug(f"     🔧 更新视图属性payload: {update_payload}")
 
                 endpoint = f"bitable/v1/apps/{self.config.app_token}/tables/{table_id}/views/{view_id}"
                 result = self._make_request('PATCH', endpoint, json=update_payload)
-                debug(f"     📋 更新API响应: {result}")
+                if is_verbose():
+                    debug(f"     📋 更新API响应: {result}")
                 return True
             else:
                 debug("     ⚠️ 没有视图属性需要更新")
@@ -103,9 +126,10 @@ class FeishuViewMixin:
 
         except Exception as e:
             print(f"   ❌ 配置视图属性失败: {e}")
-            import traceback
+            if is_verbose():
+                import traceback
 
-            debug(f"   🔍 详细错误: {traceback.format_exc()}")
+                debug(f"   🔍 详细错误: {traceback.format_exc()}")
             return False
 
     def _build_view_property(self, table_id: str, view_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -161,17 +185,6 @@ class FeishuViewMixin:
         # 获取字段ID
         field_id = field_mapping.get(field, field)
 
-        # 操作符映射（视图属性可能使用不同的操作符）
-        operator_map = {
-            'gte': 'isGreaterThanOrEqualTo',
-            'lte': 'isLessThanOrEqualTo',
-            'gt': 'isGreaterThan',
-            'lt': 'isLessThan',
-            'eq': 'is',
-            'contains': 'contains',
-            'not_contains': 'doesNotContain',
-        }
-
         # 特殊处理日期相关操作符
         if operator == 'gte_days_ago':
             from datetime import datetime, timedelta
@@ -180,7 +193,7 @@ class FeishuViewMixin:
             value = int(days_ago.timestamp() * 1000)
             operator = 'gte'
 
-        feishu_operator = operator_map.get(operator, 'is')
+        feishu_operator = _COMPARISON_OPERATORS.get(operator, 'is')
 
         return {
             "field_id": field_id,
@@ -220,17 +233,6 @@ class FeishuViewMixin:
         # 获取字段ID
         field_id = field_mapping.get(field, field)
 
-        # 操作符映射
-        operator_map = {
-            'gte': 'isGreaterThanOrEqualTo',
-            'lte': 'isLessThanOrEqualTo',
-            'gt': 'isGreaterThan',
-            'lt': 'isLessThan',
-            'eq': 'is',
-            'contains': 'contains',
-            'not_contains': 'doesNotContain',
-        }
-
         # 特殊处理日期相关操作符
         if operator == 'gte_days_ago':
             # 计算N天前的时间戳
@@ -240,7 +242,7 @@ class FeishuViewMixin:
             value = int(days_ago.timestamp() * 1000)
             operator = 'gte'
 
-        feishu_operator = operator_map.get(operator, 'is')
+        feishu_operator = _COMPARISON_OPERATORS.get(operator, 'is')
 
         return {
             "field_name": field_id,
@@ -290,7 +292,7 @@ class FeishuViewMixin:
             if auto_cleanup:
                 for view_name, view_id in existing_view_names.items():
                     # 跳过默认视图
-                    if view_name in ['表格视图', 'Grid View', '默认视图']:
+                    if view_name in _DEFAULT_VIEW_NAMES:
                         continue
 
                     if view_name not in target_view_names:
@@ -370,7 +372,8 @@ class FeishuViewMixin:
             field_id = field_mapping.get(field_name)
             if not field_id:
                 debug(f"       ❌ 排序字段 '{field_name}' 未找到")
-                debug(f"       🔍 可用字段: {list(field_mapping.keys())}")
+                if is_verbose():
+                    debug(f"       🔍 可用字段: {list(field_mapping.keys())}")
                 continue
 
             sort_spec = {"field_id": field_id, "desc": direction == 'desc'}
@@ -391,15 +394,4 @@ class FeishuViewMixin:
 
     def _convert_operator(self, operator: str) -> str:
         """转换操作符为飞书API格式"""
-        operator_map = {
-            'gte': 'isGreaterThanOrEqualTo',
-            'lte': 'isLessThanOrEqualTo',
-            'gt': 'isGreaterThan',
-            'lt': 'isLessThan',
-            'eq': 'is',
-            'contains': 'contains',
-            'not_contains': 'doesNotContain',
-            'is_empty': 'isEmpty',
-            'is_not_empty': 'isNotEmpty',
-        }
-        return operator_map.get(operator, 'is')
+        return _FEISHU_OPERATORS.get(operator, 'is')
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..terminal import print
 
@@ -14,6 +15,53 @@ except ImportError:
     RAPIDFUZZ_AVAILABLE = False
     print("⚠️  rapidfuzz 不可用，使用 difflib 作为备用方案")
 
+_SEPARATOR_RUN = re.compile(r"[-_/]+")
+_OR_SEPARATOR = re.compile(r"\s+or\s+", re.IGNORECASE)
+_WORD_CHAR = re.compile(r"\w")
+_WORDS_AND_SPACES = re.compile(r"[\w\s]+")
+_WORD_TOKEN = re.compile(r"\b\w+\b")
+
+
+@lru_cache(maxsize=256)
+def _prepared_text(text: str) -> Tuple[str, str]:
+    """返回 (小写文本, 分隔符归一化文本)
+
+    同一篇论文的全文会与每个关键词及其变体逐一比较，按文本缓存后每篇论文只需预处理一次。
+    """
+    lowered = text.lower()
+    return lowered, _SEPARATOR_RUN.sub(" ", lowered)
+
+
+@lru_cache(maxsize=256)
+def _whitespace_words(text: str) -> Tuple[str, ...]:
+    """按空白切分文本；模糊匹配时每个关键词都会遍历同一篇论文的词表"""
+    return tuple(text.split())
+
+
+@lru_cache(maxsize=256)
+def _word_tokens(text: str) -> Tuple[str, ...]:
+    """提取小写单词序列，供 rapidfuzz/difflib 模糊评分复用"""
+    return tuple(_WORD_TOKEN.findall(text.lower()))
+
+
+@lru_cache(maxsize=1024)
+def _keyword_pattern(keyword: str) -> Tuple[Optional[re.Pattern[str]], bool]:
+    """按关键词编译整词匹配模式，返回 (模式, 是否仅由单词字符和空白组成)
+
+    关键词集合在一次运行中固定，编译结果可在所有论文之间复用。
+    """
+    normalized_keyword = _SEPARATOR_RUN.sub(" ", keyword)
+    if not _WORD_CHAR.search(normalized_keyword):
+        return None, False
+    pattern = re.compile(r"(?<!\w)" + re.escape(normalized_keyword) + r"(?!\w)")
+    return pattern, bool(_WORDS_AND_SPACES.fullmatch(normalized_keyword))
+
+
+@lru_cache(maxsize=256)
+def _split_or_keyword(keyword_item: str) -> Tuple[str, ...]:
+    """拆分 "A OR B" 形式的关键词项（大小写不敏感，兼容多空格）"""
+    return tuple(part.strip() for part in _OR_SEPARATOR.split(keyword_item) if part.strip())
+
 
 class KeywordMatchingMixin:
     def check_required_keywords(
@@ -87,7 +135,7 @@ class KeywordMatchingMixin:
             List[str]: 匹配到的具体关键词列表
         """
         # 检查是否包含OR逻辑
-        if re.search(r"\s+or\s+", keyword_item, flags=re.IGNORECASE):
+        if _OR_SEPARATOR.search(keyword_item):
             return self._check_or_keyword_detailed(keyword_item, full_text, fuzzy_match, similarity_threshold)
         else:
             # 单个关键词
@@ -112,7 +160,7 @@ class KeywordMatchingMixin:
             List[str]: 匹配到的具体关键词列表
         """
         # 分割OR关键词，大小写不敏感，并兼容多空格
-        or_parts = [part.strip() for part in re.split(r"\s+or\s+", or_keyword, flags=re.IGNORECASE) if part.strip()]
+        or_parts = _split_or_keyword(or_keyword)
 
         if len(or_parts) < 2:
             return []
@@ -151,10 +199,8 @@ class KeywordMatchingMixin:
         # 模糊匹配（如果启用）
         if fuzzy_match:
             # 检查关键词变体
-            keyword_variants = self._generate_keyword_variants(keyword)
-
-            for variant in keyword_variants:
-                if self._contains_keyword(variant.lower(), full_text):
+            for variant in self._lowered_keyword_variants(keyword):
+                if self._contains_keyword(variant, full_text):
                     return True
 
             # 使用字符串相似度匹配
@@ -163,6 +209,17 @@ class KeywordMatchingMixin:
 
         return False
 
+    def _lowered_keyword_variants(self, keyword: str) -> Tuple[str, ...]:
+        """返回去重后的小写关键词变体
+
+        变体只取决于关键词和同义词表，按关键词缓存后每个关键词只生成一次，而不是每篇论文生成一次。
+        """
+        variants = self._variant_cache.get(keyword)
+        if variants is None:
+            variants = tuple(dict.fromkeys(variant.lower() for variant in self._generate_keyword_variants(keyword)))
+            self._variant_cache[keyword] = variants
+        return variants
+
     def _generate_keyword_variants(self, keyword: str) -> List[str]:
         """
         生成关键词变体
@@ -223,7 +280,7 @@ class KeywordMatchingMixin:
             from difflib import SequenceMatcher
 
             # 分词处理
-            words = text.split()
+            words = _whitespace_words(text)
 
             # 检查与单个词的相似度
             for word in words:
@@ -285,7 +342,7 @@ class KeywordMatchingMixin:
             return 1.0
 
         # 分词并限制检查范围以提高效率
-        words = re.findall(r"\b\w+\b", text.lower())
+        words = _word_tokens(text)
         if not words:
             return 0.0
 
@@ -308,7 +365,7 @@ class KeywordMatchingMixin:
         if self._contains_keyword(keyword_lower, text):
             return 1.0
 
-        words = re.findall(r"\b\w+\b", text.lower())
+        words = _word_tokens(text)
         if not words:
             return 0.0
 
@@ -407,18 +464,17 @@ class KeywordMatchingMixin:
     def _contains_keyword(keyword: str, text: str) -> bool:
         """Match whole tokens for normal keywords and normalized phrases."""
         keyword = str(keyword or "").strip().lower()
-        text = str(text or "").lower()
+        text = str(text or "")
         if not keyword or not text:
             return False
 
-        normalized_keyword = re.sub(r"[-_/]+", " ", keyword)
-        normalized_text = re.sub(r"[-_/]+", " ", text)
+        text, normalized_text = _prepared_text(text)
+        pattern, word_only = _keyword_pattern(keyword)
 
-        if re.search(r"[\w]", normalized_keyword, flags=re.UNICODE):
-            pattern = r"(?<!\w)" + re.escape(normalized_keyword) + r"(?!\w)"
-            if re.search(pattern, normalized_text):
+        if pattern is not None:
+            if pattern.search(normalized_text):
                 return True
-            if re.fullmatch(r"[\w\s]+", normalized_keyword, flags=re.UNICODE):
+            if word_only:
                 return False
 
         return keyword in text
@@ -23,6 +23,8 @@ class PaperRanker(KeywordMatchingMixin, BaseScoringMixin, AdvancedScoringMixin):
         # 匹配缓存
         self._match_cache = {}
         self._max_cache_size = 1000
+        # 关键词变体缓存（小写，按原始关键词索引）
+        self._variant_cache = {}
 
         # 同义词词典 - 可以扩展
         self.synonyms = {
@@ -13,7 +13,7 @@ from omegaconf import DictConfig
 from ..configuration.keywords import load_keywords_from_config
 from ..configuration.loader import find_sync_configs, load_config, normalize_config
 from ..core import PaperRanker, SearchService, create_arxiv_api
-from ..terminal import debug, print, section, table
+from ..terminal import debug, is_verbose, print, section, table
 
 try:
     from ..feishu import FeishuSyncResult, create_chat_notifier_from_config, sync_papers_to_feishu
@@ -413,7 +413,8 @@ def send_batch_summary_notification(
 
     except Exception as exc:
         print(f"❌ 发送汇总通知失败: {exc}")
-        traceback.print_exc()
+        if is_verbose():
+            traceback.print_exc()
         return False
 
 
@@ -17,7 +17,13 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 MASTER_REF = "master"
 
 
-pytestmark = pytest.mark.network
+pytestmark = [
+    pytest.mark.network,
+    pytest.mark.skipif(
+        os.getenv("AUTOPAPER_RUN_NETWORK_TESTS") != "1",
+        reason="set AUTOPAPER_RUN_NETWORK_TESTS=1 to run live arXiv smoke tests",
+    ),
+]
 
 
 def _load_master_arxiv_core(tmp_path: Path):
@@ -40,9 +46,6 @@ def _load_master_arxiv_core(tmp_path: Path):
 
 
 def test_live_arxiv_search_returns_results_and_matches_master(tmp_path):
-    if os.getenv("AUTOPAPER_RUN_NETWORK_TESTS") != "1":
-        pytest.skip("set AUTOPAPER_RUN_NETWORK_TESTS=1 to run live arXiv smoke tests")
-
     env_file = os.getenv("AUTOPAPER_ENV_FILE")
     if env_file and Path(env_file).exists():
         load_dotenv(env_file, override=True)
@@ -6,7 +6,7 @@ import pytest
 from omegaconf import OmegaConf
 
 from autopaper.feishu.records import FeishuRecordMixin
-from autopaper.feishu.sync import sync_papers_to_feishu
+from autopaper.feishu.sync import _extract_existing_arxiv_ids, sync_papers_to_feishu
 from autopaper.feishu.sync_result import FeishuSyncResult
 from autopaper.sync.runner import SyncRunner, send_batch_summary_notification
 
@@ -70,10 +70,15 @@ def test_feishu_sync_uses_hydra_config_and_returns_structured_result(monkeypatch
             assert table_name == "测试论文表"
             return "tbl"
 
-        def get_all_records(self, table_id):
+        def search_records_by_field(self, table_id, field_name, values):
             assert table_id == "tbl"
+            assert field_name == "ArXiv ID"
+            assert values == ["2601.00001"]
             return []
 
+        def count_records(self, table_id):
+            return 0
+
         def batch_insert_records(self, table_id, batch):
             assert table_id == "tbl"
             assert batch[0]["ArXiv ID"]["text"] == "2601.00001"
@@ -100,9 +105,12 @@ def test_feishu_sync_reports_batch_write_failures(monkeypatch):
         def find_table_by_name(self, table_name):
             return "tbl"
 
-        def get_all_records(self, table_id):
+        def search_records_by_field(self, table_id, field_name, values):
             return []
 
+        def count_records(self, table_id):
+            return 0
+
         def batch_insert_records(self, table_id, batch):
             raise RuntimeError("boom")
 
@@ -197,3 +205,65 @@ def test_check_record_exists_does_not_mask_lookup_errors():
 
     with pytest.raises(RuntimeError, match="lookup failed"):
         BrokenRecordClient().check_record_exists("tbl", "2601.00001")
+
+
+def test_existing_record_lookup_filters_candidate_ids_on_the_server():
+    requests_seen = []
+
+    class SearchClient(FeishuRecordMixin):
+        config = type("Config", (), {"app_token": "app-token"})()
+
+        def _make_request(self, method, endpoint, **kwargs):
+            requests_seen.append((method, endpoint, kwargs))
+            values = [condition["value"][0] for condition in kwargs["json"]["filter"]["conditions"]]
+            return {"items": [{"fields": {"ArXiv ID": [{"text": values[0], "type": "text"}]}}], "has_more": False}
+
+    ids = [f"2601.{index:05d}" for index in range(3)]
+    records = SearchClient().search_records_by_field("tbl", "ArXiv ID", ids + [ids[0], ""], chunk_size=2)
+
+    assert [call[0] for call in requests_seen] == ["POST", "POST"]
+    assert all(call[1].endswith("/tables/tbl/records/search") for call in requests_seen)
+    assert requests_seen[0][2]["json"]["filter"]["conjunction"] == "or"
+    assert len(requests_seen[0][2]["json"]["filter"]["conditions"]) == 2
+    assert _extract_existing_arxiv_ids(records) == {"2601.00000", "2601.00002"}
+
+
+def test_feishu_sync_skips_existing_hyperlink_arxiv_ids_found_by_server_search(monkeypatch):
+    inserted = []
+
+    class HyperlinkTableConnector(FeishuRecordMixin):
+        def __init__(self, config):
+            self.config = config
+
+        def find_table_by_name(self, table_name):
+            return "tbl"
+
+        def _make_request(self, method, endpoint, **kwargs):
+            assert endpoint.endswith("/tables/tbl/records/search")
+            values = [condition["value"][0] for condition in kwargs["json"]["filter"]["conditions"]]
+            assert values == ["2601.00001", "2601.00002"]
+            # 论文表的 ArXiv ID 是超链接字段（type 15），查询接口返回 {"text", "link"}；
+            # 额外返回一条非候选记录，确认只按本次候选去重
+            return {
+                "items": [
+                    {"fields": {"ArXiv ID": {"text": "2601.00001", "link": "https://arxiv.org/abs/2601.00001"}}},
+                    {"fields": {"ArXiv ID": {"text": "2501.99999", "link": "https://arxiv.org/abs/2501.99999"}}},
+                ],
+                "has_more": False,
+            }
+
+        def count_records(self, table_id):
+            return 2
+
+        def batch_insert_records(self, table_id, batch):
+            inserted.extend(record["ArXiv ID"]["text"] for record in batch)
+            return {"records": [{"record_id": "rec"} for _ in batch]}
+
+    monkeypatch.setattr("autopaper.feishu.sync.FeishuBitableConnector", HyperlinkTableConnector)
+
+    result = sync_papers_to_feishu([_paper(), _paper(arxiv_id="2601.00002")], _cfg())
+
+    assert result.success is True
+    assert result.skipped_existing == 1
+    assert result.synced_count == 1
+    assert inserted == ["2601.00002"]
@@ -180,6 +180,106 @@ def test_token_helpers_are_usable_from_new_feishu_module(monkeypatch, tmp_path):
     env_file.write_text("FEISHU_APP_ID=app-id\nFEISHU_TENANT_ACCESS_TOKEN=old\n", encoding="utf-8")
     assert update_env_file("new-token", str(env_file))
     assert "FEISHU_TENANT_ACCESS_TOKEN=new-token" in env_file.read_text(encoding="utf-8")
+    assert env_file.stat().st_mode & 0o777 == 0o600
+    assert [path.name for path in tmp_path.iterdir()] == [".env"]
+
+    mtime_ns = env_file.stat().st_mtime_ns
+    assert update_env_file("new-token", str(env_file))
+    assert env_file.stat().st_mtime_ns == mtime_ns
+
+
+def test_tenant_token_is_reused_across_connectors_in_one_process(monkeypatch):
+    calls = []
+
+    class FakeResponse:
+        def json(self):
+            return {"code": 0, "tenant_access_token": "t-fresh-" + "2" * 24, "expire": 7200}
+
+    def fake_post(self, url, json, timeout):
+        calls.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr("autopaper.feishu.auth._TENANT_TOKEN_CACHE", {})
+    monkeypatch.setattr("autopaper.feishu.auth.requests.Session.post", fake_post)
+
+    def make_config():
+        return FeishuBitableConfig(
+            app_id="cli_a_cache",
+            app_secret="secret",
+            tenant_access_token="t-stale-" + "1" * 24,
+            app_token="app_token",
+        )
+
+    first = FeishuBitableConnector(make_config())
+    assert first.refresh_token_if_needed()
+    assert first.config.tenant_access_token.startswith("t-fresh-")
+
+    second_config = make_config()
+    second = FeishuBitableConnector(second_config)
+    assert second_config.tenant_access_token.startswith("t-stale-")
+    assert second.session.headers["Authorization"].startswith("Bearer t-fresh-")
+    # 通知客户端刷新时会用自己的 config 新建连接器取令牌，应直接拿到缓存
+    assert second.get_tenant_access_token().startswith("t-fresh-")
+    assert len(calls) == 1
+
+    # 缓存令牌被服务端判定过期后，刷新必须重新请求
+    assert second.refresh_token_if_needed()
+    assert len(calls) == 2
+
+
+def test_table_lookup_is_cached_per_bitable_and_invalidated_on_create(monkeypatch):
+    listed = []
+    tables = [{"name": "论文表", "table_id": "tbl_1"}]
+
+    def fake_request(self, method, endpoint, **kwargs):
+        if method == "GET":
+            listed.append(endpoint)
+            return {"items": list(tables)}
+        tables.append({"name": kwargs["json"]["table"]["name"], "table_id": "tbl_2"})
+        return {"table_id": "tbl_2"}
+
+    monkeypatch.setattr("autopaper.feishu.tables._TABLE_ID_CACHE", {})
+    monkeypatch.setattr(FeishuBitableConnector, "_make_request", fake_request)
+
+    def make_connector():
+        return FeishuBitableConnector(
+            FeishuBitableConfig(app_id="", app_secret="", user_access_token="u-" + "1" * 32, app_token="app_token")
+        )
+
+    assert make_connector().find_table_by_name("论文表") == "tbl_1"
+    assert make_connector().find_table_by_name("论文表") == "tbl_1"
+    assert len(listed) == 1
+
+    connector = make_connector()
+    connector.create_table("新表")
+    assert connector.find_table_by_name("新表") == "tbl_2"
+    assert connector.find_table_by_name("论文表") == "tbl_1"
+    assert len(listed) == 2
+
+
+def test_view_creation_reuses_the_table_field_mapping(monkeypatch):
+    requests_made = []
+
+    def fake_request(self, method, endpoint, **kwargs):
+        requests_made.append((method, endpoint.rsplit("/", 1)[-1]))
+        if endpoint.endswith("/fields"):
+            return {"items": [{"field_name": "相关性评分", "field_id": "fld_score"}]}
+        if method == "GET":
+            return {"items": []}
+        if method == "POST":
+            return {"view": {"view_id": f"vew_{len(requests_made)}"}}
+        return {}
+
+    monkeypatch.setattr(FeishuBitableConnector, "_make_request", fake_request)
+    connector = FeishuBitableConnector(
+        FeishuBitableConfig(app_id="", app_secret="", user_access_token="u-" + "1" * 32, app_token="app_token")
+    )
+    views = [{"name": name, "sorts": [{"field": "相关性评分", "direction": "desc"}]} for name in ("高分", "最新")]
+
+    result = connector.manage_table_views("tbl", views, auto_cleanup=False)
+
+    assert result["created"] == 2
+    assert requests_made.count(("GET", "fields")) == 1
 
 
 def test_display_report_still_writes_markdown(tmp_path):
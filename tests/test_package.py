@@ -33,6 +33,18 @@ def test_extended_config_normalizes_to_runtime_schema():
     assert cfg.user_profile.research_area == "vision_language_navigation"
 
 
+def test_config_parse_cache_is_isolated_and_tracks_file_changes(tmp_path):
+    config_path = tmp_path / "custom.yaml"
+    config_path.write_text("search:\n  days: 3\n", encoding="utf-8")
+
+    first = load_config("custom", config_dir=tmp_path, apply_default=False)
+    first.search.days = 99
+    assert load_config("custom", config_dir=tmp_path, apply_default=False).search.days == 3
+
+    config_path.write_text("search:\n  days: 12\n", encoding="utf-8")
+    assert load_config("custom", config_dir=tmp_path, apply_default=False).search.days == 12
+
+
 def test_arxiv_query_includes_category_and_date_range(tmp_path):
     api = ArxivAPI(timeout=1, download_dir=str(tmp_path))
     query = api._build_search_query(